@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Generate the lookup indexes embedded in index.html.
+
+Usage: python3 build_index.py [index.html]
+
+Reads VOCAB, ENGLISH_VOCAB and ANALOGIES from the page and writes
+`const SEARCH_INDEX = {...};` and `const FILTER_INDEX = {...};` back into
+it (replacing any previous copies). Datasets missing from the page are
+skipped. Re-run after editing the datasets. Both indexes carry a content
+fingerprint of the fields they were built from; when it no longer matches,
+the page falls back to unindexed filtering/search.
+
+SEARCH_INDEX layout (all ids are plain array positions):
+  sources  - [[dataset name, first doc id, entry count, fingerprint of the
+             searched fields], ...]; doc ids are global, VOCAB entries first,
+             then ENGLISH_VOCAB, then ANALOGIES
+  terms    - sorted normalized terms joined with ' '
+  postings - per term, a flat list of doc*4+field (field: 2 word,
+             1 definition, 0 example), doc ids delta-encoded
+The trigram map used for substring lookups is built from `terms` in the
+browser while idle after the app starts, and Hebrew prefix letters are
+stripped from the query there, so neither is shipped in the page.
+
+FILTER_INDEX layout, per dataset (VOCAB, ENGLISH_VOCAB):
+  fingerprint - fingerprint() of the entries' word/unit fields; the page
+                ignores the index when it no longer matches
+  order - entry indices in collation order (position = collation rank)
+  units - [[unit, entry indices in collation order], ...] sorted by unit,
+          so "unit" sort is their concatenation and a single unit is one
+          list. Only the "alpha"/"unit" sorts use them; other sorts keep
+          data order
+
+normalize() must stay in sync with searchNormalize() in index.html, and
+fingerprint() with datasetFingerprint().
+"""
+
+import json, re, sys, unicodedata
+from collections import defaultdict
+
+from vocab_data import find_dataset
+
+_NIQQUD = re.compile(r'[֑-ׇ]')
+_FINALS = str.maketrans('ךםןףץ', 'כמנפצ')
+_JOINERS = re.compile(r'["\'׳״]')  # quotes/geresh inside words: צה"ל, don't
+_NON_WORD = re.compile(r'[^0-9a-zא-ת]+')
+
+# Field codes double as ranks: a word hit outranks a definition hit, etc.
+FIELD_WORD, FIELD_DEF, FIELD_EXAMPLE = 2, 1, 0
+
+# Which entry fields are searched, per dataset, with their field weight
+SEARCH_FIELDS = {
+    'VOCAB': [('word', FIELD_WORD), ('definition', FIELD_DEF), ('example', FIELD_EXAMPLE)],
+    'ENGLISH_VOCAB': [('word', FIELD_WORD), ('def', FIELD_DEF), ('heb', FIELD_DEF), ('example', FIELD_EXAMPLE)],
+    'ANALOGIES': [('a', FIELD_WORD), ('b', FIELD_WORD), ('c', FIELD_WORD), ('d', FIELD_WORD)],
+}
+
+
+def normalize(text):
+    """Lowercase, drop niqqud, fold final letters and turn everything else into spaces."""
+    text = _NIQQUD.sub('', str(text).lower()).translate(_FINALS)
+    text = _JOINERS.sub('', text)
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def _delta(values):
+    out, prev = [], 0
+    for v in values:
+        out.append(v - prev)
+        prev = v
+    return out
+
+
+def _add(hits, doc, field):
+    if hits.get(doc, -1) < field:
+        hits[doc] = field
+
+
+def build_search_index(datasets):
+    sources = []
+    postings = defaultdict(dict)  # term -> {doc: best field}
+    doc = 0
+    for name, fields in SEARCH_FIELDS.items():
+        entries = datasets.get(name, [])
+        sources.append([name, doc, len(entries), fingerprint(entries, [key for key, _ in fields])])
+        for entry in entries:
+            for key, field in fields:
+                for token in normalize(entry.get(key, '')).split():
+                    _add(postings[token], doc, field)
+            doc += 1
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        docs = sorted(postings[term])
+        fields = [postings[term][d] for d in docs]
+        encoded.append([d * 4 + f for d, f in zip(_delta(docs), fields)])
+
+    return {
+        'sources': sources,
+        'terms': ' '.join(terms),
+        'postings': encoded,
+    }
+
+
+def hebrew_collation_key(word):
+    """Approximates localeCompare(..., 'he'): niqqud and final letter forms
+    only break ties."""
+    word = str(word)
+    return _NIQQUD.sub('', word).translate(_FINALS), word
+
+
+def english_collation_key(word):
+    """Approximates localeCompare(..., 'en'): accents and case only break
+    ties, lowercase first."""
+    word = str(word)
+    base = ''.join(c for c in unicodedata.normalize('NFKD', word) if not unicodedata.combining(c))
+    return base.casefold(), word.swapcase()
+
+
+def _js_str(value):
+    """String(value) as JavaScript would print it for the field types used here."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def fingerprint(entries, fields):
+    """32-bit FNV-1a over the UTF-16 code units of the given fields of every
+    entry, so an in-place edit (not just a changed entry count) is noticed."""
+    h = 0x811c9dc5
+    for entry in entries:
+        text = '\x1f'.join(_js_str(entry.get(f)) for f in fields) + '\x1e'
+        data = text.encode('utf-16-le')
+        for i in range(0, len(data), 2):
+            h = ((h ^ (data[i] | data[i + 1] << 8)) * 0x01000193) & 0xffffffff
+    return h
+
+
+FILTER_FIELDS = ('word', 'unit')
+
+COLLATION_KEYS = {'VOCAB': hebrew_collation_key, 'ENGLISH_VOCAB': english_collation_key}
+
+
+def build_filter_index(datasets):
+    index = {}
+    for name, key in COLLATION_KEYS.items():
+        if name not in datasets:
+            continue
+        entries = datasets[name]
+        order = sorted(range(len(entries)), key=lambda i: key(entries[i].get('word', '')))
+        units = defaultdict(list)
+        for i in order:
+            units[entries[i].get('unit')].append(i)
+        index[name] = {
+            'fingerprint': fingerprint(entries, FILTER_FIELDS),
+            'order': order,
+            'units': [[u, units[u]] for u in sorted(units, key=lambda u: (u is None, u))],
+        }
+    return index
+
+
+def replace_or_insert(content, name, value, after):
+    """Replace `const NAME = ...;` in content, or insert it after dataset `after`."""
+    literal = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    found = find_dataset(content, name)
+    if found is not None:
+        _, start, end = found
+        return content[:start] + literal + content[end:]
+    found = find_dataset(content, after)
+    if found is None:
+        raise ValueError(f'Cannot place {name}: `const {after}` not found')
+    end = content.index(';', found[2]) + 1
+    return content[:end] + f'\n\n// Generated by build_index.py - do not edit by hand\nconst {name} = {literal};' + content[end:]
+
+
+def main(path='index.html'):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    datasets = {}
+    for name in SEARCH_FIELDS:
+        found = find_dataset(content, name)
+        if found is None:
+            print(f'Warning: `const {name}` not found in {path}, skipping it')
+        else:
+            datasets[name] = found[0]
+
+    index = build_search_index(datasets)
+    content = replace_or_insert(content, 'SEARCH_INDEX', index, after='ANALOGIES')
+    filters = build_filter_index(datasets)
+    content = replace_or_insert(content, 'FILTER_INDEX', filters, after='SEARCH_INDEX')
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    terms = index['terms'].count(' ') + 1
+    print(f"SEARCH_INDEX: {terms} terms, {sum(map(len, index['postings']))} postings")
+    for name, f in filters.items():
+        print(f"FILTER_INDEX.{name}: {len(f['order'])} entries, {len(f['units'])} units")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
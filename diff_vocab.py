@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Entry-level diff of the datasets embedded in two copies of index.html.
+
+Usage: python3 diff_vocab.py [OLD] [NEW] [--json] [--limit N]
+
+Defaults to comparing index.html.backup against index.html. Every entry is
+indexed by its content hash and by its identity key, so the diff is linear
+in the number of entries. Entries are classified in this order:
+
+  unchanged  - identical content (possibly at a different position)
+  modified   - same identity key, different fields
+  renamed    - identity changed but a fuzzy key still matches
+               (identity with spacing/punctuation/niqqud removed,
+               identical remaining fields, or for analogies one
+               unchanged pair: a corrected a/b or c/d)
+  added / removed - everything left over
+"""
+
+import argparse, json, re, sys
+from collections import defaultdict, deque
+
+from vocab_data import DATASETS, load_datasets
+
+# Fields that identify an entry within its dataset
+IDENTITY = {
+    'VOCAB': ('word',),
+    'ENGLISH_VOCAB': ('word',),
+    'ENGLISH_SENTENCES': ('sentence',),
+    'ANALOGIES': ('a', 'b', 'c', 'd'),
+}
+
+# Subsets of the identity that still pair an entry after one part was corrected
+PARTIAL_IDENTITY = {
+    'ANALOGIES': [('a', 'b'), ('c', 'd')],
+}
+
+# Niqqud/cantillation marks, whitespace and punctuation are ignored when
+# fuzzy-matching identities ("זרהמ לח עלהפ צע ים" ~ "זרה מלח על הפצעים")
+_FUZZY_STRIP = re.compile(r'[֑-ׇ\s\W_]+')
+
+
+def content_hash(entry):
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True)
+
+
+def identity_key(name, entry):
+    return tuple(str(entry.get(f, '')) for f in IDENTITY.get(name, ()))
+
+
+def fuzzy_identity_key(name, entry):
+    key = tuple(_FUZZY_STRIP.sub('', v).lower() for v in identity_key(name, entry))
+    return key if any(key) else None
+
+
+def rest_key(name, entry):
+    identity = IDENTITY.get(name, ())
+    rest = {k: v for k, v in entry.items() if k not in identity}
+    if not any(v not in ('', None, []) for k, v in rest.items() if k != 'unit'):
+        return None  # nothing distinctive left to match on
+    return content_hash(rest)
+
+
+def field_changes(old, new):
+    changes = {}
+    for k in list(old) + [k for k in new if k not in old]:
+        if old.get(k) != new.get(k):
+            changes[k] = [old.get(k), new.get(k)]
+    return changes
+
+
+def _match(old_left, new_left, key_fn):
+    """Pair remaining old/new indices whose key_fn values are equal.
+
+    Returns the list of (old_idx, new_idx) pairs and removes them from
+    old_left/new_left (dicts used as insertion-ordered sets).
+    """
+    index = defaultdict(deque)
+    for i, entry in new_left.items():
+        key = key_fn(entry)
+        if key is not None:
+            index[key].append(i)
+    pairs = []
+    for i, entry in list(old_left.items()):
+        key = key_fn(entry)
+        bucket = index.get(key) if key is not None else None
+        if bucket:
+            j = bucket.popleft()
+            pairs.append((i, j))
+            del old_left[i]
+            del new_left[j]
+    return pairs
+
+
+def diff_dataset(name, old, new):
+    old_left = dict(enumerate(old))
+    new_left = dict(enumerate(new))
+
+    unchanged = _match(old_left, new_left, content_hash)
+    modified = _match(old_left, new_left, lambda e: identity_key(name, e))
+    renamed = _match(old_left, new_left, lambda e: fuzzy_identity_key(name, e))
+    renamed += _match(old_left, new_left, lambda e: rest_key(name, e))
+    for fields in PARTIAL_IDENTITY.get(name, ()):
+        renamed += _match(old_left, new_left, lambda e: tuple(str(e.get(f, '')) for f in fields))
+
+    def pair(i, j):
+        return {'old_index': i, 'new_index': j,
+                'old_id': ' / '.join(identity_key(name, old[i])),
+                'new_id': ' / '.join(identity_key(name, new[j])),
+                'changes': field_changes(old[i], new[j])}
+
+    return {
+        'old_count': len(old),
+        'new_count': len(new),
+        'unchanged': len(unchanged),
+        'moved': sum(1 for i, j in unchanged if i != j),
+        'added': [{'index': j, 'entry': e} for j, e in new_left.items()],
+        'removed': [{'index': i, 'entry': e} for i, e in old_left.items()],
+        'renamed': [pair(i, j) for i, j in renamed],
+        'modified': [pair(i, j) for i, j in modified],
+    }
+
+
+def diff_files(old_path, new_path):
+    old = load_datasets(old_path)
+    new = load_datasets(new_path)
+    report = {}
+    for name in DATASETS:
+        if name in old or name in new:
+            report[name] = diff_dataset(name, old.get(name, []), new.get(name, []))
+    return report
+
+
+def print_report(report, limit):
+    def section(title, items, fmt):
+        if not items:
+            return
+        print(f'  {title} ({len(items)}):')
+        for item in items[:limit]:
+            print('    ' + fmt(item))
+        if len(items) > limit:
+            print(f'    ... and {len(items) - limit} more')
+
+    for name, d in report.items():
+        print(f"{name}: {d['old_count']} -> {d['new_count']} entries, "
+              f"{d['unchanged']} unchanged ({d['moved']} moved), "
+              f"{len(d['modified'])} modified, {len(d['renamed'])} renamed, "
+              f"{len(d['added'])} added, {len(d['removed'])} removed")
+        section('Removed', d['removed'],
+                lambda r: f"[{r['index']}] \"{' / '.join(identity_key(name, r['entry']))}\"")
+        section('Added', d['added'],
+                lambda a: f"[{a['index']}] \"{' / '.join(identity_key(name, a['entry']))}\"")
+        section('Renamed', d['renamed'],
+                lambda p: f"\"{p['old_id']}\" → \"{p['new_id']}\"")
+        section('Modified', d['modified'],
+                lambda p: f"\"{p['new_id']}\": " + ', '.join(p['changes']))
+        print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('old', nargs='?', default='index.html.backup')
+    parser.add_argument('new', nargs='?', default='index.html')
+    parser.add_argument('--json', action='store_true', help='print the full report as JSON')
+    parser.add_argument('--limit', type=int, default=30, help='entries listed per section (text output)')
+    args = parser.parse_args(argv)
+
+    report = diff_files(args.old, args.new)
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        print_report(report, args.limit)
+
+
+if __name__ == '__main__':
+    main()
@@ -699,3 +699,7 @@ print("\n--- Sample fixed entries ---")
 sample_fixes = [(k, v) for k, v in word_fixes.items() if v != k][:30]
 for orig, fixed in sample_fixes:
     print(f'  "{orig}" → "{fixed}"')
+
+# Regenerate SEARCH_INDEX/FILTER_INDEX so they keep pointing at the right entries
+import build_index
+build_index.main('index.html')
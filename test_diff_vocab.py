@@ -0,0 +1,55 @@
+from diff_vocab import diff_dataset
+
+
+def word(w, definition='', unit=1):
+    return {'word': w, 'definition': definition, 'example': '', 'unit': unit}
+
+
+def analogy(a, b, c, d, **extra):
+    return dict(a=a, b=b, c=c, d=d, type='synonym', unit=1, **extra)
+
+
+def test_unchanged_and_moved():
+    old = [word('אבן', 'x'), word('דלת', 'y')]
+    d = diff_dataset('VOCAB', old, old[::-1])
+    assert d['unchanged'] == 2 and d['moved'] == 2
+    assert not (d['added'] or d['removed'] or d['modified'] or d['renamed'])
+
+
+def test_modified_by_identity():
+    d = diff_dataset('VOCAB', [word('אבן', 'old')], [word('אבן', 'new', unit=2)])
+    [m] = d['modified']
+    assert m['changes'] == {'definition': ['old', 'new'], 'unit': [1, 2]}
+    assert d['unchanged'] == 0 and not d['renamed']
+
+
+def test_fuzzy_renamed_spacing_and_niqqud():
+    old = [word('קבלעם ועדה', 'x'), word('שָׁלוֹם', 'y')]
+    new = [word('קבל עם ועדה', 'x2'), word('שלום', 'y2')]
+    d = diff_dataset('VOCAB', old, new)
+    assert [(p['old_id'], p['new_id']) for p in d['renamed']] == [
+        ('קבלעם ועדה', 'קבל עם ועדה'), ('שָׁלוֹם', 'שלום')]
+
+
+def test_renamed_by_remaining_fields():
+    d = diff_dataset('VOCAB', [word('גוהר', 'רוכן מעל')], [word('רכן', 'רוכן מעל')])
+    assert [(p['old_id'], p['new_id']) for p in d['renamed']] == [('גוהר', 'רכן')]
+
+
+def test_duplicate_identities_pair_in_order():
+    old = [word('בהיר', 'a'), word('בהיר', 'b')]
+    new = [word('בהיר', 'b'), word('בהיר', 'c'), word('בהיר', 'd')]
+    d = diff_dataset('VOCAB', old, new)
+    assert d['unchanged'] == 1
+    assert [(m['old_index'], m['new_index']) for m in d['modified']] == [(0, 1)]
+    assert [a['index'] for a in d['added']] == [2]
+    assert not d['removed']
+
+
+def test_corrected_analogy_is_renamed():
+    old = [analogy('בוחל', 'מואס', 'אוב', 'חפץ'), analogy('דהוי', 'דהוי', 'עז', 'חזק')]
+    new = [analogy('בוחל', 'מואס', 'חומד', 'משתוקק', explanation='...'),
+           analogy('דהוי', 'חיוור', 'עז', 'חזק', explanation='...')]
+    d = diff_dataset('ANALOGIES', old, new)
+    assert [(p['old_index'], p['new_index']) for p in d['renamed']] == [(0, 0), (1, 1)]
+    assert not (d['added'] or d['removed'])
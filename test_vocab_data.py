@@ -0,0 +1,47 @@
+import pytest
+
+from vocab_data import find_dataset
+
+
+def parse(literal):
+    return find_dataset(f'const X = {literal};', 'X')[0]
+
+
+def test_js_object_literal():
+    text = '''[
+      // Unit 1
+      { word: "אבן", 'unit': 1, wrong: ["a", "b",], },
+      /* block */ {a:"x",b:-2.5,c:true,d:null}
+    ]'''
+    assert parse(text) == [
+        {'word': 'אבן', 'unit': 1, 'wrong': ['a', 'b']},
+        {'a': 'x', 'b': -2.5, 'c': True, 'd': None},
+    ]
+
+
+@pytest.mark.parametrize('literal, expected', [
+    (r'"a\"b"', 'a"b'),
+    (r"'it\'s'", "it's"),
+    (r'"tab\tnl\n"', 'tab\tnl\n'),
+    (r'"\x41א\u{1F600}"', 'Aא😀'),
+    ('"line\\\ncontinued"', 'linecontinued'),
+])
+def test_string_escapes(literal, expected):
+    assert parse(literal) == expected
+
+
+def test_find_dataset_span():
+    content = 'let a = 1;\nconst VOCAB = [{word: "x"}];\nconst B = 2;'
+    value, start, end = find_dataset(content, 'VOCAB')
+    assert value == [{'word': 'x'}]
+    assert content[start:end] == '[{word: "x"}]'
+    assert find_dataset(content, 'MISSING') is None
+
+
+@pytest.mark.parametrize('literal', [
+    '[{a:1},', '{a:1,', '{a:', '{', '"abc', '"abc\\', r'"\xZZ"', r'"\u12"',
+    '[1 2]', '{a 1}', '/* open',
+])
+def test_malformed_input_raises_value_error(literal):
+    with pytest.raises(ValueError):
+        find_dataset('const X = ' + literal, 'X')
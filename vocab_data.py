@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Read the datasets embedded in index.html as plain Python objects.
+
+The datasets are JavaScript object literals (unquoted keys, comments,
+trailing commas), not JSON, so they are parsed with a small single-pass
+reader instead of json.loads.
+"""
+
+import re
+
+DATASETS = ['VOCAB', 'ENGLISH_VOCAB', 'ENGLISH_SENTENCES', 'ANALOGIES']
+
+_IDENT = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+_NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+class _Reader:
+    def __init__(self, text, pos):
+        self.text = text
+        self.pos = pos
+
+    def error(self, msg):
+        line = self.text.count('\n', 0, self.pos) + 1
+        raise ValueError(f'{msg} at line {line}')
+
+    def skip(self):
+        text, n = self.text, len(self.text)
+        while self.pos < n:
+            c = text[self.pos]
+            if c in ' \t\r\n':
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = n if end < 0 else end + 1
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos + 2)
+                if end < 0:
+                    self.error('Unterminated comment')
+                self.pos = end + 2
+            else:
+                break
+
+    def value(self):
+        self.skip()
+        text = self.text
+        if self.pos >= len(text):
+            self.error('Unexpected end of input')
+        c = text[self.pos]
+        if c == '[':
+            return self.array()
+        if c == '{':
+            return self.obj()
+        if c in '"\'`':
+            return self.string()
+        m = _NUMBER.match(text, self.pos)
+        if m:
+            self.pos = m.end()
+            s = m.group()
+            return float(s) if any(ch in s for ch in '.eE') else int(s)
+        m = _IDENT.match(text, self.pos)
+        if m and m.group() in _LITERALS:
+            self.pos = m.end()
+            return _LITERALS[m.group()]
+        self.error(f'Unexpected character {c!r}')
+
+    def string(self):
+        text = self.text
+        quote = text[self.pos]
+        self.pos += 1
+        parts = []
+        start = self.pos
+        while True:
+            if self.pos >= len(text):
+                self.error('Unterminated string')
+            c = text[self.pos]
+            if c == quote:
+                parts.append(text[start:self.pos])
+                self.pos += 1
+                return ''.join(parts)
+            if c == '\\':
+                parts.append(text[start:self.pos])
+                if self.pos + 1 >= len(text):
+                    self.error('Unterminated string')
+                esc = text[self.pos + 1]
+                if esc == 'u' and text.startswith('{', self.pos + 2):
+                    end = text.find('}', self.pos + 3)
+                    parts.append(chr(self.hex(self.pos + 3, end)))
+                    self.pos = end + 1
+                elif esc in 'ux':
+                    width = 4 if esc == 'u' else 2
+                    parts.append(chr(self.hex(self.pos + 2, self.pos + 2 + width)))
+                    self.pos += 2 + width
+                elif esc == '\n':
+                    self.pos += 2
+                else:
+                    parts.append(_ESCAPES.get(esc, esc))
+                    self.pos += 2
+                start = self.pos
+            else:
+                self.pos += 1
+
+    def hex(self, start, end):
+        digits = self.text[start:end] if start < end <= len(self.text) else ''
+        if not digits or any(c not in '0123456789abcdefABCDEF' for c in digits):
+            self.error('Invalid escape sequence')
+        return int(digits, 16)
+
+    def array(self):
+        self.pos += 1
+        items = []
+        while True:
+            self.skip()
+            if self.text.startswith(']', self.pos):
+                self.pos += 1
+                return items
+            items.append(self.value())
+            self.skip()
+            if self.text.startswith(',', self.pos):
+                self.pos += 1
+            elif not self.text.startswith(']', self.pos):
+                self.error("Expected ',' or ']'")
+
+    def obj(self):
+        self.pos += 1
+        result = {}
+        while True:
+            self.skip()
+            if self.text.startswith('}', self.pos):
+                self.pos += 1
+                return result
+            if self.text.startswith(('"', "'"), self.pos):
+                key = self.string()
+            else:
+                m = _IDENT.match(self.text, self.pos) or _NUMBER.match(self.text, self.pos)
+                if not m:
+                    self.error('Expected property name')
+                key = m.group()
+                self.pos = m.end()
+            self.skip()
+            if not self.text.startswith(':', self.pos):
+                self.error("Expected ':'")
+            self.pos += 1
+            result[key] = self.value()
+            self.skip()
+            if self.text.startswith(',', self.pos):
+                self.pos += 1
+            elif not self.text.startswith('}', self.pos):
+                self.error("Expected ',' or '}'")
+
+
+def find_dataset(content, name):
+    """Return (value, start, end) for `const NAME = ...;`, or None if absent.
+
+    start/end delimit the literal itself, so content[start:end] can be
+    replaced in place.
+    """
+    m = re.search(r'\bconst %s\s*=\s*' % re.escape(name), content)
+    if not m:
+        return None
+    reader = _Reader(content, m.end())
+    value = reader.value()
+    return value, m.end(), reader.pos
+
+
+def load_datasets(path, names=DATASETS):
+    """Return {name: list} for every dataset in `names` present in the file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    datasets = {}
+    for name in names:
+        found = find_dataset(content, name)
+        if found is not None:
+            datasets[name] = found[0]
+    return datasets